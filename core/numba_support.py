@@ -0,0 +1,29 @@
+"""
+Optional numba support shared by the analysis code.
+
+numba is not a hard dependency; without it the kernels run as plain Python.
+"""
+
+from typing import Callable
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+
+def compile_kernel(func: Callable) -> Callable:
+    """
+    Compile a numeric kernel with numba when it is installed.
+
+    Args:
+        func: Kernel written in the numba-compatible subset of Python
+
+    Returns:
+        The compiled kernel, or func unchanged if numba is unavailable
+    """
+    if NUMBA_AVAILABLE:
+        return njit(cache=True, nogil=True)(func)
+    return func
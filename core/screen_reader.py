@@ -6,23 +6,52 @@ It provides functionality to hide the application window during screenshot
 capture to avoid capturing the app interface itself.
 """
 
+import functools
+import hashlib
 import logging
 import os
 import time
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import subprocess
 import platform
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 
 try:
     import pytesseract
-    from PIL import ImageGrab
+    from PIL import Image, ImageGrab
     TESSERACT_AVAILABLE = True
 except ImportError:
     TESSERACT_AVAILABLE = False
     pytesseract = None
+    Image = None
     ImageGrab = None
 
+try:
+    from tesserocr import PyTessBaseAPI
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+    PyTessBaseAPI = None
+
+try:
+    import cv2
+    import numpy as np
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+    cv2 = None
+    np = None
+
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+    mss = None
+
 try:
     import tkinter as tk
 except ImportError:
@@ -31,6 +60,42 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Adaptive threshold parameters used when binarizing images before OCR
+_ADAPTIVE_BLOCK_SIZE = 31
+_ADAPTIVE_C = 15
+
+# Number of recognized screenshots kept in the OCR result cache
+_OCR_CACHE_SIZE = 32
+
+
+@functools.lru_cache(maxsize=1)
+def _query_screen_dims() -> Tuple[int, int]:
+    """
+    Query the screen dimensions from the platform.
+    
+    The result is cached since creating a throwaway Tk root is expensive
+    and the screen size rarely changes during a session.
+    
+    Returns:
+        Tuple of (width, height) in pixels
+    """
+    if platform.system() == 'Windows':
+        import ctypes
+        user32 = ctypes.windll.user32
+        return (user32.GetSystemMetrics(0), user32.GetSystemMetrics(1))
+    else:
+        # For Linux/Mac, try using tkinter
+        if tk:
+            root = tk.Tk()
+            root.withdraw()
+            width = root.winfo_screenwidth()
+            height = root.winfo_screenheight()
+            root.destroy()
+            return (width, height)
+        else:
+            logger.warning("Cannot determine screen dimensions")
+            return (0, 0)
+
 
 class ScreenReader:
     """
@@ -56,6 +121,15 @@ class ScreenReader:
         self.is_hidden = False
         self.screenshot_dir = Path.home() / ".ai-reading-assistant" / "screenshots"
         self.screenshot_dir.mkdir(parents=True, exist_ok=True)
+        self._sct = None
+        # In-process Tesseract handles, keyed by language
+        self._ocr_apis: Dict[str, 'PyTessBaseAPI'] = {}
+        # tesserocr handles are not thread-safe; async reads share them
+        self._ocr_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Recognized text keyed by image content hash and OCR settings
+        self._ocr_cache: 'OrderedDict[bytes, str]' = OrderedDict()
+        self._cache_lock = threading.Lock()
         
         # Initialize Tesseract if path provided
         if tesseract_path and TESSERACT_AVAILABLE:
@@ -99,14 +173,22 @@ class ScreenReader:
         try:
             self.parent_window.withdraw()
             self.is_hidden = True
-            # Give the window a moment to fully hide
-            time.sleep(0.1)
+            # Let the window manager process the unmap before we grab the screen
+            self._flush_window_events()
+            if platform.system() == 'Linux' and os.environ.get('XDG_SESSION_TYPE') == 'x11':
+                # X11 compositors may still be fading the window out
+                time.sleep(0.02)
             logger.debug("Parent window hidden successfully")
             return True
         except Exception as e:
-            logger.error(f"Failed to hide parent window: {e}")
+            logger.error("Failed to hide parent window: %s", e)
             return False
     
+    def _flush_window_events(self) -> None:
+        """Process pending window events so visibility changes take effect."""
+        self.parent_window.update_idletasks()
+        self.parent_window.update()
+    
     def show_window(self) -> bool:
         """
         Show the parent application window.
@@ -121,11 +203,11 @@ class ScreenReader:
         try:
             self.parent_window.deiconify()
             self.is_hidden = False
-            time.sleep(0.1)
+            self._flush_window_events()
             logger.debug("Parent window shown successfully")
             return True
         except Exception as e:
-            logger.error(f"Failed to show parent window: {e}")
+            logger.error("Failed to show parent window: %s", e)
             return False
     
     def capture_screenshot(self, 
@@ -146,23 +228,76 @@ class ScreenReader:
             return None
         
         try:
-            screenshot = ImageGrab.grab(bbox=bbox)
+            if MSS_AVAILABLE:
+                screenshot = self._grab_with_mss(bbox)
+            else:
+                screenshot = ImageGrab.grab(bbox=bbox)
             
             if save_image:
                 timestamp = int(time.time())
                 filename = self.screenshot_dir / f"screenshot_{timestamp}.png"
                 screenshot.save(filename)
-                logger.debug(f"Screenshot saved to {filename}")
+                logger.debug("Screenshot saved to %s", filename)
             
             logger.debug("Screenshot captured successfully")
             return screenshot
         except Exception as e:
-            logger.error(f"Failed to capture screenshot: {e}")
+            logger.error("Failed to capture screenshot: %s", e)
             return None
     
+    def _grab_with_mss(self, bbox: Optional[Tuple[int, int, int, int]] = None):
+        """
+        Grab the screen with a persistent mss handle.
+        
+        Args:
+            bbox: Bounding box as (left, top, right, bottom), or None for full screen
+        
+        Returns:
+            PIL Image object in RGB mode
+        """
+        # Reuse one mss instance instead of reopening the display per grab
+        if self._sct is None:
+            self._sct = mss.mss()
+        
+        if bbox is None:
+            # monitors[0] spans every display; the primary one matches ImageGrab.grab()
+            region = self._sct.monitors[1]
+        else:
+            left, top, right, bottom = bbox
+            region = {'left': left, 'top': top,
+                      'width': right - left, 'height': bottom - top}
+        
+        raw = self._sct.grab(region)
+        # Decode the BGRA buffer straight to RGB, skipping mss' intermediate .rgb copy
+        return Image.frombuffer('RGB', raw.size, raw.bgra, 'raw', 'BGRX')
+    
+    def _preprocess_image(self, image):
+        """
+        Binarize an image so Tesseract works on a bilevel input.
+        
+        Uses OpenCV adaptive thresholding when available, otherwise a plain
+        PIL threshold.
+        
+        Args:
+            image: PIL Image object
+        
+        Returns:
+            Preprocessed PIL Image object
+        """
+        gray = image.convert('L')
+        if CV2_AVAILABLE:
+            binary = cv2.adaptiveThreshold(
+                np.asarray(gray), 255,
+                cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY,
+                _ADAPTIVE_BLOCK_SIZE, _ADAPTIVE_C
+            )
+            return Image.fromarray(binary)
+        return gray.convert('1', dither=Image.Dither.NONE)
+    
     def extract_text(self, image=None, 
                     language: str = 'eng',
-                    config: str = '') -> Optional[str]:
+                    config: str = '',
+                    preprocess: bool = True) -> Optional[str]:
         """
         Extract text from an image using Tesseract OCR.
         
@@ -170,6 +305,7 @@ class ScreenReader:
             image: PIL Image object. If None, captures a new screenshot
             language: Tesseract language code (default: 'eng')
             config: Additional Tesseract configuration string
+            preprocess: Whether to binarize the image before OCR
         
         Returns:
             Extracted text string, or None if OCR fails
@@ -184,10 +320,35 @@ class ScreenReader:
                 if image is None:
                     return None
             
-            # Perform OCR
-            text = pytesseract.image_to_string(image, lang=language, config=config)
-            logger.debug(f"OCR completed, extracted {len(text)} characters")
-            return text.strip() if text else None
+            # Unchanged screens skip Tesseract entirely
+            cache_key = self._ocr_cache_key(image, language, config, preprocess)
+            with self._cache_lock:
+                cached = self._ocr_cache.get(cache_key)
+                if cached is not None:
+                    self._ocr_cache.move_to_end(cache_key)
+                    logger.debug("OCR cache hit")
+                    return cached
+            
+            if preprocess:
+                image = self._preprocess_image(image)
+            
+            # Perform OCR, in-process when tesserocr is available
+            if TESSEROCR_AVAILABLE and not config:
+                with self._ocr_lock:
+                    api = self._get_ocr_api(language)
+                    api.SetImage(image)
+                    text = api.GetUTF8Text()
+            else:
+                text = pytesseract.image_to_string(image, lang=language, config=config)
+            logger.debug("OCR completed, extracted %d characters", len(text))
+            text = text.strip() if text else None
+            
+            if text:
+                with self._cache_lock:
+                    self._ocr_cache[cache_key] = text
+                    if len(self._ocr_cache) > _OCR_CACHE_SIZE:
+                        self._ocr_cache.popitem(last=False)
+            return text
         except pytesseract.TesseractNotFoundError:
             logger.error(
                 "Tesseract not found. Please install: "
@@ -195,9 +356,89 @@ class ScreenReader:
             )
             return None
         except Exception as e:
-            logger.error(f"OCR text extraction failed: {e}")
+            logger.error("OCR text extraction failed: %s", e)
             return None
     
+    @staticmethod
+    def _ocr_cache_key(image, language: str, config: str, preprocess: bool) -> bytes:
+        """
+        Build the OCR cache key for an image and its recognition settings.
+        
+        Args:
+            image: PIL Image object
+            language: Tesseract language code
+            config: Additional Tesseract configuration string
+            preprocess: Whether the image will be binarized before OCR
+        
+        Returns:
+            Digest identifying the image content and settings
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{image.mode}|{image.size}|{language}|{config}|{preprocess}".encode())
+        h.update(image.tobytes())
+        return h.digest()
+    
+    def extract_text_regions(self, image,
+                             regions: List[Tuple[int, int, int, int]],
+                             language: str = 'eng',
+                             preprocess: bool = True) -> List[Optional[str]]:
+        """
+        Extract text from several regions of one image.
+        
+        With tesserocr the image is loaded once and each region is recognized
+        via SetRectangle; otherwise each region is cropped and OCR'd separately.
+        
+        Args:
+            image: PIL Image object
+            regions: Bounding boxes as (left, top, right, bottom)
+            language: Tesseract language code
+            preprocess: Whether to binarize the image before OCR
+        
+        Returns:
+            Extracted text per region, None where OCR fails
+        """
+        if not TESSEROCR_AVAILABLE:
+            return [self.extract_text(image=image.crop(region), language=language,
+                                      preprocess=preprocess)
+                    for region in regions]
+        
+        with self._ocr_lock:
+            try:
+                if preprocess:
+                    image = self._preprocess_image(image)
+                api = self._get_ocr_api(language)
+                api.SetImage(image)
+            except Exception as e:
+                logger.error("OCR text extraction failed: %s", e)
+                return [None] * len(regions)
+            
+            results = []
+            for left, top, right, bottom in regions:
+                try:
+                    api.SetRectangle(left, top, right - left, bottom - top)
+                    text = api.GetUTF8Text()
+                    results.append(text.strip() if text else None)
+                except Exception as e:
+                    logger.error("OCR text extraction failed: %s", e)
+                    results.append(None)
+            return results
+    
+    def _get_ocr_api(self, language: str) -> 'PyTessBaseAPI':
+        """
+        Get the cached tesserocr handle for a language, creating it on first use.
+        
+        Args:
+            language: Tesseract language code
+        
+        Returns:
+            Initialized PyTessBaseAPI instance
+        """
+        api = self._ocr_apis.get(language)
+        if api is None:
+            api = PyTessBaseAPI(lang=language)
+            self._ocr_apis[language] = api
+        return api
+    
     def capture_and_read(self, 
                         bbox: Optional[Tuple[int, int, int, int]] = None,
                         language: str = 'eng',
@@ -213,18 +454,60 @@ class ScreenReader:
         Returns:
             Extracted text, or None if operation fails
         """
+        screenshot = self._capture_hidden(bbox=bbox, save_image=save_image)
+        if screenshot is None:
+            return None
+        
+        # Extract text with the window already visible again
+        return self.extract_text(image=screenshot, language=language)
+    
+    def capture_and_read_async(self,
+                               bbox: Optional[Tuple[int, int, int, int]] = None,
+                               language: str = 'eng',
+                               save_image: bool = False) -> 'Future[Optional[str]]':
+        """
+        Capture a screenshot now and run OCR on a background thread.
+        
+        The window is hidden only for the capture itself, so the caller gets
+        the UI back while recognition is still running.
+        
+        Args:
+            bbox: Bounding box for screenshot (left, top, right, bottom)
+            language: Tesseract language code
+            save_image: Whether to save captured image
+        
+        Returns:
+            Future resolving to the extracted text, or None if operation fails
+        """
+        screenshot = self._capture_hidden(bbox=bbox, save_image=save_image)
+        if screenshot is None:
+            future: Future = Future()
+            future.set_result(None)
+            return future
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ocr')
+        return self._executor.submit(self.extract_text, image=screenshot, language=language)
+    
+    def _capture_hidden(self,
+                        bbox: Optional[Tuple[int, int, int, int]] = None,
+                        save_image: bool = False):
+        """
+        Capture a screenshot while the parent window is hidden.
+        
+        Args:
+            bbox: Bounding box for screenshot (left, top, right, bottom)
+            save_image: Whether to save captured image
+        
+        Returns:
+            PIL Image object if successful, None otherwise
+        """
         # Hide window
         self.hide_window()
         
         try:
             # Capture screenshot
-            screenshot = self.capture_screenshot(bbox=bbox, save_image=save_image)
-            if screenshot is None:
-                return None
-            
-            # Extract text
-            text = self.extract_text(image=screenshot, language=language)
-            return text
+            return self.capture_screenshot(bbox=bbox, save_image=save_image)
         finally:
             # Always show window again
             self.show_window()
@@ -237,24 +520,13 @@ class ScreenReader:
             Tuple of (width, height) in pixels
         """
         try:
-            if platform.system() == 'Windows':
-                import ctypes
-                user32 = ctypes.windll.user32
-                return (user32.GetSystemMetrics(0), user32.GetSystemMetrics(1))
-            else:
-                # For Linux/Mac, try using tkinter
-                if tk:
-                    root = tk.Tk()
-                    root.withdraw()
-                    width = root.winfo_screenwidth()
-                    height = root.winfo_screenheight()
-                    root.destroy()
-                    return (width, height)
-                else:
-                    logger.warning("Cannot determine screen dimensions")
-                    return (0, 0)
+            # The parent window already holds a Tk connection we can query for free
+            if self.parent_window:
+                return (self.parent_window.winfo_screenwidth(),
+                        self.parent_window.winfo_screenheight())
+            return _query_screen_dims()
         except Exception as e:
-            logger.error(f"Failed to get screen dimensions: {e}")
+            logger.error("Failed to get screen dimensions: %s", e)
             return (0, 0)
     
     def cleanup(self) -> None:
@@ -265,9 +537,18 @@ class ScreenReader:
         try:
             if self.is_hidden:
                 self.show_window()
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._sct is not None:
+                self._sct.close()
+                self._sct = None
+            for api in self._ocr_apis.values():
+                api.End()
+            self._ocr_apis.clear()
             logger.debug("ScreenReader cleanup completed")
         except Exception as e:
-            logger.error(f"Cleanup error: {e}")
+            logger.error("Cleanup error: %s", e)
 
 
 # Convenience function for quick screenshot reading without class instantiation
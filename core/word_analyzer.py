@@ -4,15 +4,19 @@ Implements Zipf's Law for word frequency analysis and context-based word meaning
 """
 
 import re
-import math
 from collections import Counter, defaultdict
-from typing import Dict, List, Tuple, Optional, Set
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, Iterable, List, Tuple, Optional, Set, FrozenSet
+import numpy as np
 import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
+from nltk.tokenize import sent_tokenize
 from nltk.corpus import stopwords
 from nltk.tag import pos_tag
 from nltk.chunk import ne_chunk
 
+from core.numba_support import NUMBA_AVAILABLE, compile_kernel
+
 # Download required NLTK data
 try:
     nltk.data.find('tokenizers/punkt')
@@ -29,6 +33,136 @@ try:
 except LookupError:
     nltk.download('averaged_perceptron_tagger')
 
+# Shared lookups, built once at import instead of on every analysis call
+_STOP_WORDS: FrozenSet[str] = frozenset(stopwords.words('english'))
+# 1/rank for the ranks considered by the Zipf metrics
+_INV_RANK = np.reciprocal(np.arange(1, 101, dtype=np.float64))
+# Cue words used to infer how a word is used in its sentences
+_DESCRIPTIVE_CUES: FrozenSet[str] = frozenset({'is', 'are', 'was', 'were', 'being'})
+_ACTION_CUES: FrozenSet[str] = frozenset({'do', 'does', 'did', 'doing'})
+_RELATIONAL_CUES: FrozenSet[str] = frozenset({'in', 'on', 'at', 'with'})
+# Runs of letters; an apostrophe suffix ("company's", "don't") is matched but
+# not captured, so the stem is kept and the clitic dropped, as word_tokenize did
+_WORD_RE = re.compile(r"([^\W\d_]+)(?:'[^\W\d_]+)*")
+
+
+def _fast_tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens with a compiled regex.
+
+    Args:
+        text: Input text
+
+    Returns:
+        List of lowercase tokens; punctuation and digits are dropped
+    """
+    return _WORD_RE.findall(text.lower())
+
+
+def _content_tokens(tokens: Iterable[str]) -> List[str]:
+    """
+    Keep the tokens that carry content for frequency analysis.
+
+    Args:
+        tokens: Lowercase word tokens
+
+    Returns:
+        Tokens with punctuation, single characters and stopwords removed
+    """
+    # Cheapest check first
+    return [token for token in tokens
+            if token.isalpha() and len(token) > 1 and token not in _STOP_WORDS]
+
+
+def _zipf_kernel(freqs: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Compute Zipf correlation and summary statistics in a single pass.
+
+    Args:
+        freqs: Word frequencies sorted by rank (float64, non-empty)
+
+    Returns:
+        Tuple of (correlation, rank-1 frequency, average of the top 10 frequencies)
+    """
+    n = freqs.shape[0]
+    top = freqs[0]
+    sum_x = 0.0
+    sum_y = 0.0
+    sum_xx = 0.0
+    sum_yy = 0.0
+    sum_xy = 0.0
+    top10 = 0.0
+
+    for i in range(n):
+        x = freqs[i]
+        # Zipf's Law: frequency ≈ constant / rank
+        y = top / (i + 1)
+        sum_x += x
+        sum_y += y
+        sum_xx += x * x
+        sum_yy += y * y
+        sum_xy += x * y
+        if i < 10:
+            top10 += x
+
+    correlation = 0.0
+    if n >= 2:
+        var_x = n * sum_xx - sum_x * sum_x
+        var_y = n * sum_yy - sum_y * sum_y
+        if var_x > 0.0 and var_y > 0.0:
+            correlation = (n * sum_xy - sum_x * sum_y) / np.sqrt(var_x * var_y)
+
+    return correlation, top, top10 / 10.0
+
+
+_zipf_kernel = compile_kernel(_zipf_kernel)
+
+
+@dataclass
+class _TokenBundle:
+    """
+    Sentences and tokens of a text, produced once and shared between analyzers.
+    """
+
+    text: str
+    sentences: List[str]
+    sentence_tokens: List[List[str]]
+
+    @classmethod
+    def from_text(cls, text: str) -> '_TokenBundle':
+        """
+        Split text into sentences and tokenize each sentence.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Token bundle for the text
+        """
+        sentences = sent_tokenize(text)
+        return cls(text, sentences, [_fast_tokenize(sentence) for sentence in sentences])
+
+    @cached_property
+    def flat_tokens(self) -> List[str]:
+        """Content tokens of the whole text, with stopwords and single characters removed."""
+        return _content_tokens(token for tokens in self.sentence_tokens for token in tokens)
+
+    @cached_property
+    def vocabulary(self) -> Tuple[Dict[str, int], List[str], List[np.ndarray]]:
+        """
+        Map every token to a compact integer id, per sentence.
+
+        Returns:
+            Tuple of (token to id mapping, tokens by id, id array of each sentence)
+        """
+        vocab: Dict[str, int] = {}
+        sentence_ids = [
+            np.fromiter((vocab.setdefault(t, len(vocab)) for t in tokens),
+                        dtype=np.int32, count=len(tokens))
+            for tokens in self.sentence_tokens
+        ]
+        return vocab, list(vocab), sentence_ids
+
 
 class ZipfsLawAnalyzer:
     """
@@ -53,14 +187,38 @@ class ZipfsLawAnalyzer:
             Dictionary containing frequency analysis and Zipf's Law metrics
         """
         # Tokenize and clean text
-        tokens = self._tokenize_and_clean(text)
+        return self._analyze_tokens(self._tokenize_and_clean(text))
+
+    def analyze_text_prepared(self, bundle: _TokenBundle) -> Dict:
+        """
+        Analyze an already tokenized text using Zipf's Law principles.
+
+        Args:
+            bundle: Token bundle shared with other analyzers
+
+        Returns:
+            Dictionary containing frequency analysis and Zipf's Law metrics
+        """
+        return self._analyze_tokens(bundle.flat_tokens)
+
+    def _analyze_tokens(self, tokens: List[str]) -> Dict:
+        """
+        Run the frequency analysis over cleaned tokens.
+
+        Args:
+            tokens: Cleaned tokens of the text
+
+        Returns:
+            Dictionary containing frequency analysis and Zipf's Law metrics
+        """
         self.total_words = len(tokens)
         
         # Count word frequencies
         self.word_frequencies = Counter(tokens)
         
         # Rank words by frequency
-        self.ranked_words = self.word_frequencies.most_common()
+        # Only the top 100 ranks are ever used, so skip sorting the full table
+        self.ranked_words = self.word_frequencies.most_common(100)
         
         # Calculate Zipf's Law metrics
         zipf_metrics = self._calculate_zipf_metrics()
@@ -83,21 +241,9 @@ class ZipfsLawAnalyzer:
         Returns:
             List of cleaned tokens
         """
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters but keep apostrophes for contractions
-        text = re.sub(r"[^\w\s'-]", '', text)
-        
-        # Tokenize
-        tokens = word_tokenize(text)
-        
-        # Remove stopwords and single characters
-        stop_words = set(stopwords.words('english'))
-        tokens = [token for token in tokens 
-                 if token not in stop_words and len(token) > 1 and token.isalpha()]
-        
-        return tokens
+        # Same tokenization as _TokenBundle, so both entry points agree; the
+        # regex splits on punctuation, which therefore needs no separate pass
+        return _content_tokens(_fast_tokenize(text))
 
     def _calculate_zipf_metrics(self) -> Dict:
         """
@@ -109,27 +255,25 @@ class ZipfsLawAnalyzer:
         if not self.ranked_words:
             return {}
 
-        ranks = []
-        frequencies = []
-        expected_frequencies = []
-
-        for rank, (word, freq) in enumerate(self.ranked_words[:100], 1):
-            ranks.append(rank)
-            frequencies.append(freq)
-            # Zipf's Law: frequency ≈ constant / rank
-            expected_freq = self.ranked_words[0][1] / rank
-            expected_frequencies.append(expected_freq)
+        frequencies = np.asarray([freq for _, freq in self.ranked_words[:100]], dtype=np.float64)
 
-        # Calculate correlation between actual and expected Zipf distribution
-        correlation = self._calculate_correlation(frequencies, expected_frequencies)
+        if NUMBA_AVAILABLE:
+            correlation, rank_1_frequency, avg_frequency = _zipf_kernel(frequencies)
+            correlation = float(correlation)
+        else:
+            # Zipf's Law: frequency ≈ constant / rank. Pearson correlation ignores
+            # the constant, so correlate against the shared 1/rank table directly
+            correlation = self._calculate_correlation(frequencies, _INV_RANK[:len(frequencies)])
+            rank_1_frequency = frequencies[0]
+            avg_frequency = frequencies[:10].sum() / 10
 
         return {
             'top_10_words': self.ranked_words[:10],
             'zipf_correlation': correlation,
             'is_zipfian': correlation > 0.8,  # Strong Zipf distribution if correlation > 0.8
             'distribution_analysis': {
-                'rank_1_frequency': self.ranked_words[0][1] if self.ranked_words else 0,
-                'avg_frequency': sum(freq for _, freq in self.ranked_words[:10]) / 10,
+                'rank_1_frequency': int(rank_1_frequency),
+                'avg_frequency': float(avg_frequency),
                 'theoretical_vs_actual': list(zip(
                     [freq for _, freq in self.ranked_words[:10]],
                     [self.ranked_words[0][1] / (i+1) for i in range(10)]
@@ -137,7 +281,7 @@ class ZipfsLawAnalyzer:
             }
         }
 
-    def _calculate_correlation(self, actual: List[float], expected: List[float]) -> float:
+    def _calculate_correlation(self, actual: np.ndarray, expected: np.ndarray) -> float:
         """
         Calculate Pearson correlation coefficient.
 
@@ -148,22 +292,15 @@ class ZipfsLawAnalyzer:
         Returns:
             Correlation coefficient between -1 and 1
         """
-        if len(actual) < 2:
-            return 0.0
-
-        mean_actual = sum(actual) / len(actual)
-        mean_expected = sum(expected) / len(expected)
-
-        numerator = sum((actual[i] - mean_actual) * (expected[i] - mean_expected) 
-                       for i in range(len(actual)))
-        
-        denom_actual = sum((x - mean_actual) ** 2 for x in actual)
-        denom_expected = sum((x - mean_expected) ** 2 for x in expected)
-
-        if denom_actual == 0 or denom_expected == 0:
+        a = np.asarray(actual, dtype=np.float64)
+        e = np.asarray(expected, dtype=np.float64)
+        if a.size < 2:
             return 0.0
 
-        return numerator / math.sqrt(denom_actual * denom_expected)
+        # Constant inputs have zero variance; report no correlation rather than NaN
+        with np.errstate(divide='ignore', invalid='ignore'):
+            c = np.corrcoef(a, e)[0, 1]
+        return 0.0 if np.isnan(c) else float(c)
 
     def get_word_percentile(self, word: str) -> Optional[Tuple[int, float]]:
         """
@@ -176,9 +313,17 @@ class ZipfsLawAnalyzer:
             Tuple of (rank, frequency) or None if word not found
         """
         word = word.lower()
-        for rank, (w, freq) in enumerate(self.ranked_words, 1):
+        if word not in self.word_frequencies:
+            return None
+
+        # ranked_words is truncated, so rank rare words against the full table
+        ranking = self.ranked_words
+        if len(ranking) < len(self.word_frequencies):
+            ranking = self.word_frequencies.most_common()
+
+        for rank, (w, freq) in enumerate(ranking, 1):
             if w == word:
-                percentile = (rank / len(self.ranked_words)) * 100 if self.ranked_words else 0
+                percentile = (rank / len(ranking)) * 100
                 return (rank, percentile)
         return None
 
@@ -192,7 +337,11 @@ class ContextualWordAnalyzer:
         """Initialize the contextual word analyzer."""
         self.text = ""
         self.sentences = []
-        self.word_contexts = defaultdict(list)
+        # Maps each word to the indices of the sentences it appears in
+        self.word_contexts: Dict[str, List[int]] = defaultdict(list)
+        self._sentence_tokens = []
+        self._sentence_pos = []
+        self._bundle: Optional[_TokenBundle] = None
 
     def analyze_word_context(self, text: str, target_word: Optional[str] = None) -> Dict:
         """
@@ -205,8 +354,29 @@ class ContextualWordAnalyzer:
         Returns:
             Dictionary containing contextual analysis
         """
-        self.text = text
-        self.sentences = sent_tokenize(text)
+        return self.analyze_text_prepared(_TokenBundle.from_text(text), target_word)
+
+    def analyze_text_prepared(self, bundle: _TokenBundle,
+                              target_word: Optional[str] = None) -> Dict:
+        """
+        Analyze words and their contexts within an already tokenized text.
+
+        Args:
+            bundle: Token bundle shared with other analyzers
+            target_word: Specific word to analyze (if None, analyzes all)
+
+        Returns:
+            Dictionary containing contextual analysis
+        """
+        self.text = bundle.text
+        self.sentences = bundle.sentences
+        self.word_contexts = defaultdict(list)
+        
+        # Sentences are tokenized once; downstream methods index into this cache
+        self._bundle = bundle
+        self._sentence_tokens = bundle.sentence_tokens
+        # POS tags are only needed for specific-word analysis, so tag lazily
+        self._sentence_pos = [None] * len(self.sentences)
         
         # Extract context for words
         self._extract_word_contexts()
@@ -218,16 +388,28 @@ class ContextualWordAnalyzer:
             return self._analyze_all_significant_words()
 
     def _extract_word_contexts(self) -> None:
-        """Extract sentences containing each word."""
-        stop_words = set(stopwords.words('english'))
-        
-        for sentence in self.sentences:
-            tokens = word_tokenize(sentence.lower())
-            tokens = [t for t in tokens if t.isalpha()]
-            
-            for token in tokens:
-                if token not in stop_words and len(token) > 2:
-                    self.word_contexts[token].append(sentence)
+        """Extract the indices of sentences containing each word."""
+        for idx, tokens in enumerate(self._sentence_tokens):
+            # Record each sentence at most once per word
+            for token in set(tokens):
+                if token.isalpha() and token not in _STOP_WORDS and len(token) > 2:
+                    self.word_contexts[token].append(idx)
+
+    def _get_sentence_pos(self, idx: int) -> List[Tuple[str, str]]:
+        """
+        Get the POS-tagged tokens of a sentence, tagging it on first use.
+
+        Args:
+            idx: Index of the sentence
+
+        Returns:
+            List of (token, POS tag) pairs
+        """
+        tagged = self._sentence_pos[idx]
+        if tagged is None:
+            tagged = pos_tag(self._sentence_tokens[idx])
+            self._sentence_pos[idx] = tagged
+        return tagged
 
     def _analyze_specific_word(self, word: str) -> Dict:
         """
@@ -249,9 +431,8 @@ class ContextualWordAnalyzer:
                 'message': f"Word '{word}' not found in text"
             }
 
-        # Extract POS tag
-        tagged = pos_tag(word_tokenize(word))
-        pos = tagged[0][1] if tagged else 'UNKNOWN'
+        # Extract POS tag from the already-tagged context sentences
+        pos = self._most_common_pos(word, contexts)
 
         # Extract surrounding words
         surrounding_words = self._extract_surrounding_words(word, contexts)
@@ -262,12 +443,12 @@ class ContextualWordAnalyzer:
         return {
             'word': word,
             'found': True,
-            'frequency': len(contexts),
-            'part_of_speech': pos,
-            'contexts': contexts[:5],  # Return first 5 contexts
+            'frequency': sum(self._sentence_tokens[i].count(word) for i in contexts),
+            'part_of_speech': pos or 'UNKNOWN',
+            'contexts': [self.sentences[i] for i in contexts[:5]],  # Return first 5 contexts
             'surrounding_words': surrounding_words,
             'inferred_meaning': inferred_meaning,
-            'word_class': self._determine_word_class(word, contexts)
+            'word_class': self._map_pos_to_class(pos) if pos else 'Unknown'
         }
 
     def _analyze_all_significant_words(self) -> Dict:
@@ -279,12 +460,9 @@ class ContextualWordAnalyzer:
         """
         # Filter words by frequency
         word_frequencies = Counter()
-        stop_words = set(stopwords.words('english'))
         
-        for sentence in self.sentences:
-            tokens = word_tokenize(sentence.lower())
-            tokens = [t for t in tokens if t.isalpha() and t not in stop_words and len(t) > 2]
-            word_frequencies.update(tokens)
+        for tokens in self._sentence_tokens:
+            word_frequencies.update(t for t in tokens if t.isalpha() and t not in _STOP_WORDS and len(t) > 2)
 
         # Analyze top words
         significant_words = {}
@@ -307,45 +485,52 @@ class ContextualWordAnalyzer:
             }
         }
 
-    def _extract_surrounding_words(self, target_word: str, contexts: List[str]) -> Dict[str, int]:
+    def _extract_surrounding_words(self, target_word: str, contexts: List[int]) -> Dict[str, int]:
         """
         Extract words that frequently appear near the target word.
 
         Args:
             target_word: The word to find neighbors for
-            contexts: Sentences containing the word
+            contexts: Indices of sentences containing the word
 
         Returns:
             Dictionary of surrounding words and their frequencies
         """
-        surrounding = Counter()
-        stop_words = set(stopwords.words('english'))
-        
-        for context in contexts:
-            tokens = word_tokenize(context.lower())
+        # Built on first use, since only specific-word analysis needs the ids
+        vocab, id_to_word, sentence_ids = self._bundle.vocabulary
+        target_id = vocab.get(target_word)
+        if target_id is None:
+            return {}
+
+        windows = []
+        for idx in contexts:
+            ids = sentence_ids[idx]
             
-            # Find target word position
-            for i, token in enumerate(tokens):
-                if token == target_word:
-                    # Get surrounding words (within 3 words)
-                    start = max(0, i - 3)
-                    end = min(len(tokens), i + 4)
-                    
-                    for j in range(start, end):
-                        if j != i and tokens[j].isalpha():
-                            surrounding[tokens[j]] += 1
-
-        # Filter stopwords
-        return {word: count for word, count in surrounding.most_common(15) 
-                if word not in stop_words}
-
-    def _infer_meaning_from_context(self, word: str, contexts: List[str]) -> Dict:
+            # Get surrounding words (within 3 words) of every target occurrence
+            for i in np.flatnonzero(ids == target_id):
+                start = max(0, i - 3)
+                windows.append(np.delete(ids[start:i + 4], i - start))
+
+        if not windows:
+            return {}
+
+        # Drop punctuation and stopwords before counting
+        excluded = np.fromiter((not w.isalpha() or w in _STOP_WORDS for w in id_to_word),
+                               dtype=bool, count=len(id_to_word))
+        neighbors = np.concatenate(windows)
+        neighbors = neighbors[~excluded[neighbors]]
+
+        counts = np.bincount(neighbors, minlength=len(id_to_word))
+        top_ids = np.argsort(-counts, kind='stable')[:15]
+        return {id_to_word[i]: int(counts[i]) for i in top_ids if counts[i] > 0}
+
+    def _infer_meaning_from_context(self, word: str, contexts: List[int]) -> Dict:
         """
         Infer the meaning of a word from its contexts.
 
         Args:
             word: The word to analyze
-            contexts: Sentences containing the word
+            contexts: Indices of sentences containing the word
 
         Returns:
             Dictionary with inferred meaning and supporting context
@@ -356,17 +541,17 @@ class ContextualWordAnalyzer:
         # Analyze contexts for semantic clues
         semantic_indicators = defaultdict(int)
         
-        for context in contexts:
-            tokens = word_tokenize(context.lower())
+        for idx in contexts:
+            tokens = set(self._sentence_tokens[idx])
             
             # Look for common semantic patterns
-            if any(verb in tokens for verb in ['is', 'are', 'was', 'were', 'being']):
+            if not tokens.isdisjoint(_DESCRIPTIVE_CUES):
                 semantic_indicators['descriptive'] += 1
             
-            if any(verb in tokens for verb in ['do', 'does', 'did', 'doing']):
+            if not tokens.isdisjoint(_ACTION_CUES):
                 semantic_indicators['action'] += 1
             
-            if any(preposition in tokens for preposition in ['in', 'on', 'at', 'with']):
+            if not tokens.isdisjoint(_RELATIONAL_CUES):
                 semantic_indicators['relational'] += 1
 
         # Determine most likely word type
@@ -384,30 +569,28 @@ class ContextualWordAnalyzer:
             'semantic_indicators': dict(semantic_indicators)
         }
 
-    def _determine_word_class(self, word: str, contexts: List[str]) -> str:
+    def _most_common_pos(self, word: str, contexts: List[int]) -> Optional[str]:
         """
-        Determine the grammatical class of the word.
+        Find the POS tag most often assigned to the word in its contexts.
 
         Args:
-            word: The word to classify
-            contexts: Sentences containing the word
+            word: The word to look up
+            contexts: Indices of sentences containing the word
 
         Returns:
-            Grammatical class of the word
+            The most common NLTK POS tag, or None if the word was never tagged
         """
         pos_tags = Counter()
         
-        for context in contexts:
-            tagged = pos_tag(word_tokenize(context.lower()))
-            for token, pos in tagged:
+        for idx in contexts:
+            for token, pos in self._get_sentence_pos(idx):
                 if token == word:
                     pos_tags[pos] += 1
 
         if pos_tags:
-            most_common_pos = pos_tags.most_common(1)[0][0]
-            return self._map_pos_to_class(most_common_pos)
+            return pos_tags.most_common(1)[0][0]
         
-        return 'Unknown'
+        return None
 
     @staticmethod
     def _map_pos_to_class(pos_tag: str) -> str:
@@ -468,11 +651,14 @@ class WordAnalyzerIntegration:
         Returns:
             Comprehensive analysis combining both approaches
         """
+        # Tokenize once for both analyses
+        bundle = _TokenBundle.from_text(text)
+        
         # Zipf's Law analysis
-        zipf_results = self.zipf_analyzer.analyze_text(text)
+        zipf_results = self.zipf_analyzer.analyze_text_prepared(bundle)
         
         # Contextual analysis
-        context_results = self.context_analyzer.analyze_word_context(text, target_word)
+        context_results = self.context_analyzer.analyze_text_prepared(bundle, target_word)
         
         return {
             'zipf_analysis': zipf_results,
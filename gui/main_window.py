@@ -3,43 +3,243 @@ AI Reading Assistant - Main Window Implementation
 Provides the primary GUI interface for the reading assistant application.
 """
 
+import asyncio
+import codecs
+import io
+import re
 import sys
 import os
-from typing import Optional, Callable
+from typing import Any, List, Optional, Callable
 from pathlib import Path
 
+import numpy as np
+from qasync import QEventLoop, asyncSlot
+
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QLabel, QPushButton, QFileDialog, QStatusBar, QMenuBar, QMenu,
-    QToolBar, QTextEdit, QListWidget, QListWidgetItem, QProgressBar,
+    QToolBar, QPlainTextEdit, QListWidget, QListWidgetItem, QProgressBar,
     QMessageBox, QComboBox, QSpinBox, QCheckBox, QGroupBox, QGridLayout
 )
-from PyQt6.QtCore import Qt, QSize, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QIcon, QAction, QFont, QKeySequence, QColor
-from PyQt6.QtCharts import QChart, QChartView, QLineSeries
-from PyQt6.QtCore import QPointF
+from PyQt6.QtCore import Qt, QSize, QEvent, QObject, QRunnable, QThreadPool, pyqtSignal, QTimer
+from PyQt6.QtGui import QAction, QFontDatabase, QKeySequence, QTextCursor
+
+from core.numba_support import NUMBA_AVAILABLE, compile_kernel
+
+
+# Whole-word sentiment cues, matched case-insensitively in a single pass;
+# the named group that matched tells positive and negative cues apart
+_SENTIMENT_RE = re.compile(
+    r'\b(?:(?P<pos>good|great|excellent|amazing|wonderful)'
+    r'|(?P<neg>bad|poor|terrible|awful|horrible))\b',
+    re.IGNORECASE
+)
+
+# Period-delimited sentence spans, streamed so summaries stop early
+_SENTENCE_RE = re.compile(r'[^.]+')
+
+# Bytes read from disk per chunk when loading a document
+_READ_CHUNK_SIZE = 1 << 20
+
+# Characters of document text appended to the viewer per scroll step
+_PAGE_SIZE = 4096
 
 
-class WorkerThread(QThread):
-    """Worker thread for background processing."""
+def generate_summary(content: str, summary_length: int) -> str:
+    """Generate document summary."""
+    words = 0
+    summary_sentences = []
     
-    progress = pyqtSignal(int)
-    finished = pyqtSignal()
-    error = pyqtSignal(str)
+    for match in _SENTENCE_RE.finditer(content):
+        sentence = match.group().strip()
+        if not sentence:
+            continue
+        words += len(sentence.split())
+        if words > summary_length:
+            break
+        summary_sentences.append(sentence)
+    
+    return ". ".join(summary_sentences) + "." if summary_sentences else "No summary available."
+
+
+def extract_key_points(content: str) -> list:
+    """Extract key points from document."""
+    sentences = content.split('.')
+    key_points = []
+    
+    for i, sentence in enumerate(sentences[:5]):
+        if sentence.strip():
+            key_points.append(f"• {sentence.strip()}")
+    
+    return key_points if key_points else ["No key points found."]
+
+
+def _count_ascii_metrics(buf: np.ndarray):
+    """
+    Count words, word characters, periods and blank-line breaks in one pass.
+    
+    Args:
+        buf: ASCII document bytes as a uint8 array
+        
+    Returns:
+        Tuple of (word_count, total_chars, period_count, paragraph_breaks),
+        matching str.split(), str.count('.') and str.count('\n\n')
+    """
+    word_count = 0
+    total_chars = 0
+    period_count = 0
+    paragraph_breaks = 0
+    in_word = False
+    pending_newline = False
+    
+    for i in range(buf.shape[0]):
+        byte = buf[i]
+        # ASCII whitespace as understood by str.split()
+        if (9 <= byte <= 13) or (28 <= byte <= 32):
+            in_word = False
+            if byte == 10:
+                # Non-overlapping '\n\n' pairs, like str.count
+                if pending_newline:
+                    paragraph_breaks += 1
+                    pending_newline = False
+                else:
+                    pending_newline = True
+            else:
+                pending_newline = False
+        else:
+            if not in_word:
+                word_count += 1
+                in_word = True
+            total_chars += 1
+            pending_newline = False
+            if byte == 46:
+                period_count += 1
+    
+    return word_count, total_chars, period_count, paragraph_breaks
+
+
+_count_ascii_metrics = compile_kernel(_count_ascii_metrics)
+
+
+def compute_text_metrics(content: str) -> dict:
+    """Count the words, sentences, paragraphs and word characters of a document."""
+    if NUMBA_AVAILABLE and content.isascii():
+        # ASCII text has one byte per character, so a compiled byte scan gives
+        # the same counts as the str methods without building a word list
+        buf = np.frombuffer(content.encode('ascii'), dtype=np.uint8)
+        word_count, total_chars, period_count, paragraph_breaks = _count_ascii_metrics(buf)
+        return {
+            'word_count': int(word_count),
+            'sentence_count': int(period_count) + 1,
+            'paragraph_count': int(paragraph_breaks) + 1,
+            'total_chars': int(total_chars)
+        }
+    
+    # Split into words once; sentences and paragraphs only need counting
+    words_list = content.split()
+    return {
+        'word_count': len(words_list),
+        'sentence_count': content.count('.') + 1,
+        'paragraph_count': content.count('\n\n') + 1,
+        'total_chars': sum(map(len, words_list))
+    }
+
+
+def analyze_readability(metrics: dict) -> dict:
+    """Analyze document readability from precomputed text metrics."""
+    word_count = metrics['word_count']
+    avg_word_length = metrics['total_chars'] / max(word_count, 1)
     
-    def __init__(self, task: Callable, *args, **kwargs):
+    return {
+        'word_count': word_count,
+        'sentence_count': metrics['sentence_count'],
+        'paragraph_count': metrics['paragraph_count'],
+        'avg_word_length': f"{avg_word_length:.2f}",
+        'readability_score': "Easy" if avg_word_length < 5 else "Medium" if avg_word_length < 7 else "Hard"
+    }
+
+
+def analyze_sentiment(content: str) -> dict:
+    """Analyze document sentiment."""
+    positive_count = negative_count = 0
+    for match in _SENTIMENT_RE.finditer(content):
+        if match.lastgroup == 'pos':
+            positive_count += 1
+        else:
+            negative_count += 1
+    
+    if positive_count > negative_count:
+        sentiment = "Positive"
+    elif negative_count > positive_count:
+        sentiment = "Negative"
+    else:
+        sentiment = "Neutral"
+    
+    return {
+        'sentiment': sentiment,
+        'positive_words': positive_count,
+        'negative_words': negative_count
+    }
+
+
+def _read_file(path: str) -> str:
+    """
+    Read a text document from disk.
+    
+    The file is read in chunks into one reusable buffer and each chunk is
+    decoded and newline-translated as it arrives, so the only full-size
+    copy made is the final join.
+    """
+    # Strict decoding, so binary files (PDF, DOCX) fail to load instead of
+    # showing up as garbage text; newlines are translated like text mode does
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(),
+                                           translate=True)
+    chunks: List[str] = []
+    with open(path, 'rb') as file:
+        buffer = bytearray(_READ_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while read := file.readinto(buffer):
+            chunks.append(decoder.decode(view[:read]))
+        view.release()
+    chunks.append(decoder.decode(b'', final=True))
+    return ''.join(chunks)
+
+
+class FileLoadSignals(QObject):
+    """Signals emitted by a background file load."""
+    
+    # List of (path, content, metrics) tuples for every file read successfully
+    loaded = pyqtSignal(list)
+    failed = pyqtSignal(str)
+
+
+class FileLoadRunnable(QRunnable):
+    """File read task executed on the global thread pool."""
+    
+    def __init__(self, paths: List[str]):
         super().__init__()
-        self.task = task
-        self.args = args
-        self.kwargs = kwargs
+        self.paths = paths
+        self.signals = FileLoadSignals()
     
     def run(self):
-        """Execute the background task."""
-        try:
-            self.task(*self.args, **self.kwargs)
-            self.finished.emit()
-        except Exception as e:
-            self.error.emit(str(e))
+        """Read the files and precompute their text metrics."""
+        documents = []
+        for path in self.paths:
+            try:
+                content = _read_file(path)
+                documents.append((path, content, compute_text_metrics(content)))
+            except Exception as e:
+                self.signals.failed.emit(str(e))
+        # One signal per batch so the list widget is updated in a single insert
+        if documents:
+            self.signals.loaded.emit(documents)
+
+
+async def _compute_missing(cached: Any, func: Callable, *args) -> Any:
+    """Return a cached sub-result, or compute it on a worker thread."""
+    if cached is not None:
+        return cached
+    return await asyncio.to_thread(func, *args)
 
 
 class MainWindow(QMainWindow):
@@ -50,11 +250,33 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("AI Reading Assistant")
         self.setGeometry(100, 100, 1400, 900)
         
-        # Initialize application state
-        self.current_document = None
-        self.documents = []
-        self.worker_thread = None
+        # Initialize application state; documents are stored as parallel lists
+        self.current_row = -1
+        self.doc_names: List[str] = []
+        self.doc_paths: List[str] = []
+        self.doc_contents: List[str] = []
+        # Text metrics computed once by the loader; they never change afterwards
+        self.doc_metrics: List[dict] = []
+        # Serial number of each document, never reused; keys the analysis caches
+        self.doc_ids: List[int] = []
+        self._next_doc_id = 0
         self.analysis_results = {}
+        # End of the document text currently shown in document_view
+        self._view_offset = 0
+        # Sub-analysis results keyed by document serial (and summary length),
+        # so changing one setting only recomputes the affected part
+        self._summary_cache: dict = {}
+        self._key_points_cache: dict = {}
+        self._sentiment_cache: dict = {}
+        # Row last shown by _apply_selection, so repeated signals for it are ignored
+        self._last_selected_row = -1
+        # Coalesces rapid selection changes (e.g. arrow-key traversal) into one view update
+        self._sel_timer = QTimer(self)
+        self._sel_timer.setSingleShot(True)
+        self._sel_timer.setInterval(50)
+        self._sel_timer.timeout.connect(self._apply_selection)
+        # Menu and toolbar actions that start an analysis, disabled while one runs
+        self.analyze_actions: List[QAction] = []
         
         # Setup UI
         self.setup_ui()
@@ -66,6 +288,16 @@ class MainWindow(QMainWindow):
         # Apply styling
         self.apply_styles()
     
+    @property
+    def current_name(self) -> Optional[str]:
+        """Name of the selected document, or None if nothing is selected."""
+        return self.doc_names[self.current_row] if self.current_row >= 0 else None
+    
+    @property
+    def current_content(self) -> Optional[str]:
+        """Content of the selected document, or None if nothing is selected."""
+        return self.doc_contents[self.current_row] if self.current_row >= 0 else None
+    
     def setup_ui(self):
         """Setup main user interface components."""
         # Create central widget and main layout
@@ -78,7 +310,7 @@ class MainWindow(QMainWindow):
         left_layout.addWidget(QLabel("Documents"))
         
         self.document_list = QListWidget()
-        self.document_list.itemSelectionChanged.connect(self.on_document_selected)
+        self.document_list.itemSelectionChanged.connect(self._sel_timer.start)
         left_layout.addWidget(self.document_list)
         
         # Document controls
@@ -100,9 +332,16 @@ class MainWindow(QMainWindow):
         
         # Document display
         center_layout.addWidget(QLabel("Document Content"))
-        self.document_view = QTextEdit()
+        self.document_view = QPlainTextEdit()
         self.document_view.setReadOnly(True)
-        self.document_view.setFont(QFont("Courier", 10))
+        # Platform fonts avoid a substitution lookup when a named family is missing
+        document_font = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
+        document_font.setPointSize(10)
+        self.document_view.setFont(document_font)
+        # Text is loaded page by page as the user scrolls towards the end
+        self.document_view.verticalScrollBar().valueChanged.connect(self._on_document_scrolled)
+        # A taller viewport may show all loaded text, leaving nothing to scroll
+        self.document_view.viewport().installEventFilter(self)
         center_layout.addWidget(self.document_view)
         
         # Analysis controls
@@ -142,9 +381,9 @@ class MainWindow(QMainWindow):
         # Action buttons
         action_layout = QHBoxLayout()
         self.analyze_btn = QPushButton("Analyze Document")
+        self.analyze_btn.setObjectName("analyzeBtn")
         self.analyze_btn.setMinimumHeight(40)
         self.analyze_btn.clicked.connect(self.analyze_document)
-        self.analyze_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
         
         self.export_btn = QPushButton("Export Results")
         self.export_btn.clicked.connect(self.export_results)
@@ -170,9 +409,11 @@ class MainWindow(QMainWindow):
         right_layout.addWidget(QLabel("Analysis Results"))
         
         # Results tabs
-        self.results_view = QTextEdit()
+        self.results_view = QPlainTextEdit()
         self.results_view.setReadOnly(True)
-        self.results_view.setFont(QFont("Segoe UI", 9))
+        results_font = QFontDatabase.systemFont(QFontDatabase.SystemFont.GeneralFont)
+        results_font.setPointSize(9)
+        self.results_view.setFont(results_font)
         right_layout.addWidget(self.results_view)
         
         right_widget = QWidget()
@@ -231,6 +472,7 @@ class MainWindow(QMainWindow):
         analyze_action.setShortcut(Qt.KeyboardModifier.CtrlModifier | Qt.Key.Key_Return)
         analyze_action.triggered.connect(self.analyze_document)
         analysis_menu.addAction(analyze_action)
+        self.analyze_actions.append(analyze_action)
         
         # Help menu
         help_menu = menubar.addMenu("&Help")
@@ -256,6 +498,7 @@ class MainWindow(QMainWindow):
         analyze_action = QAction("Analyze", self)
         analyze_action.triggered.connect(self.analyze_document)
         toolbar.addAction(analyze_action)
+        self.analyze_actions.append(analyze_action)
         
         # Export button
         export_action = QAction("Export", self)
@@ -309,7 +552,12 @@ class MainWindow(QMainWindow):
         QPushButton:pressed {
             background-color: #0a5ea6;
         }
-        QTextEdit {
+        QPushButton#analyzeBtn {
+            background-color: #4CAF50;
+            color: white;
+            font-weight: bold;
+        }
+        QPlainTextEdit {
             border: 1px solid #ddd;
             border-radius: 4px;
             padding: 5px;
@@ -333,196 +581,270 @@ class MainWindow(QMainWindow):
         self.setStyleSheet(stylesheet)
     
     def load_document(self):
-        """Load a document from file system."""
+        """Load one or more documents from file system."""
         file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getOpenFileName(
+        file_paths, _ = file_dialog.getOpenFileNames(
             self,
             "Open Document",
             "",
             "Text Files (*.txt);;PDF Files (*.pdf);;Word Files (*.docx);;All Files (*)"
         )
         
-        if file_path:
-            try:
-                # Read file content
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    content = file.read()
-                
-                # Add to documents list
-                doc_name = Path(file_path).name
-                self.documents.append({
-                    'name': doc_name,
-                    'path': file_path,
-                    'content': content
-                })
-                
-                # Add to list widget
-                self.document_list.addItem(doc_name)
-                
-                # Select the newly added document
-                self.document_list.setCurrentRow(len(self.documents) - 1)
-                
-                self.statusBar().showMessage(f"Loaded: {doc_name}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to load document: {str(e)}")
-                self.statusBar().showMessage("Error loading document")
+        if file_paths:
+            # Read file content on the thread pool so large files don't freeze the UI
+            runnable = FileLoadRunnable(file_paths)
+            runnable.signals.loaded.connect(self._on_files_loaded)
+            runnable.signals.failed.connect(self._on_file_load_failed)
+            if len(file_paths) == 1:
+                self.statusBar().showMessage(f"Loading: {Path(file_paths[0]).name}...")
+            else:
+                self.statusBar().showMessage(f"Loading {len(file_paths)} documents...")
+            QThreadPool.globalInstance().start(runnable)
+    
+    def _on_files_loaded(self, documents: list):
+        """Add the documents read by the background loader."""
+        new_names = []
+        for file_path, content, metrics in documents:
+            # Names and paths are interned so reloading the same file shares
+            # one string object instead of allocating copies
+            doc_name = sys.intern(Path(file_path).name)
+            self.doc_names.append(doc_name)
+            self.doc_paths.append(sys.intern(file_path))
+            self.doc_contents.append(content)
+            self.doc_metrics.append(metrics)
+            self.doc_ids.append(self._next_doc_id)
+            self._next_doc_id += 1
+            new_names.append(doc_name)
+        
+        # Add to list widget in one batch insert
+        self.document_list.addItems(new_names)
+        
+        # Select the last added document
+        self.document_list.setCurrentRow(len(self.doc_names) - 1)
+        
+        if len(new_names) == 1:
+            self.statusBar().showMessage(f"Loaded: {new_names[0]}")
+        else:
+            self.statusBar().showMessage(f"Loaded {len(new_names)} documents")
+    
+    def _on_file_load_failed(self, message: str):
+        """Report a failed background load."""
+        QMessageBox.critical(self, "Error", f"Failed to load document: {message}")
+        self.statusBar().showMessage("Error loading document")
     
-    def on_document_selected(self):
-        """Handle document selection from list."""
+    def _apply_selection(self):
+        """Show the document selected in the list once selection has settled."""
         current_row = self.document_list.currentRow()
-        if current_row >= 0 and current_row < len(self.documents):
-            self.current_document = self.documents[current_row]
-            self.document_view.setText(self.current_document['content'][:2000] + "...")
-            self.statusBar().showMessage(f"Selected: {self.current_document['name']}")
+        if current_row == self._last_selected_row:
+            return
+        self._last_selected_row = current_row
+        if current_row >= 0 and current_row < len(self.doc_names):
+            self.current_row = current_row
+            self._view_offset = min(len(self.current_content), _PAGE_SIZE)
+            self.document_view.setPlainText(self.current_content[:self._view_offset])
+            self._fill_document_view()
+            self.statusBar().showMessage(f"Selected: {self.current_name}")
+    
+    def _fill_document_view(self):
+        """Append pages until the viewer can scroll or the document is fully shown."""
+        scroll_bar = self.document_view.verticalScrollBar()
+        content = self.current_content
+        while (content is not None and self._view_offset < len(content)
+               and scroll_bar.maximum() == 0):
+            self._append_next_page()
+    
+    def eventFilter(self, obj, event):
+        """Top up the document viewer when its viewport grows."""
+        if obj is self.document_view.viewport() and event.type() == QEvent.Type.Resize:
+            # Run after the resize so the scroll range reflects the new size
+            QTimer.singleShot(0, self._fill_document_view)
+        return super().eventFilter(obj, event)
+    
+    def _on_document_scrolled(self, value: int):
+        """Append the next page of the document when scrolled near the end."""
+        scroll_bar = self.document_view.verticalScrollBar()
+        if value >= scroll_bar.maximum() * 0.9:
+            self._append_next_page()
+    
+    def _append_next_page(self):
+        """Append the next page of the selected document to the viewer."""
+        content = self.current_content
+        if content is None or self._view_offset >= len(content):
+            return
+        
+        page = content[self._view_offset:self._view_offset + _PAGE_SIZE]
+        self._view_offset += len(page)
+        
+        # Insert through a separate cursor so the user's cursor and selection stay put
+        cursor = QTextCursor(self.document_view.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(page)
     
     def remove_document(self):
         """Remove selected document."""
         current_row = self.document_list.currentRow()
         if current_row >= 0:
-            self.documents.pop(current_row)
+            self.doc_names.pop(current_row)
+            self.doc_paths.pop(current_row)
+            self.doc_contents.pop(current_row)
+            self.doc_metrics.pop(current_row)
+            self._drop_analysis_caches(self.doc_ids.pop(current_row))
             self.document_list.takeItem(current_row)
             self.document_view.clear()
-            self.current_document = None
+            self.current_row = -1
+            self._last_selected_row = -1
             self.statusBar().showMessage("Document removed")
     
-    def analyze_document(self):
+    @asyncSlot()
+    async def analyze_document(self):
         """Analyze the current document."""
-        if not self.current_document:
+        if self.current_row < 0:
             QMessageBox.warning(self, "Warning", "Please load a document first.")
             return
         
+        content = self.current_content
+        doc_key = self.doc_ids[self.current_row]
+        analysis_type = self.analysis_type.currentText()
+        summary_length = self.summary_length.value()
+        include_sentiment = self.include_sentiment.isChecked()
+        # Derived from the load-time metrics, so this is always available
+        readability = analyze_readability(self.doc_metrics[self.current_row])
+        
         # Show progress bar
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
-        self.analyze_btn.setEnabled(False)
+        self._set_analysis_enabled(False)
         self.statusBar().showMessage("Analyzing document...")
         
-        # Simulate analysis process
-        self.simulate_analysis()
-    
-    def simulate_analysis(self):
-        """Simulate document analysis."""
-        analysis_type = self.analysis_type.currentText()
-        content = self.current_document['content']
+        # Missing sub-results run concurrently on worker threads while the
+        # event loop keeps the UI responsive; cached ones are reused as-is
+        if include_sentiment:
+            sentiment_step = _compute_missing(self._sentiment_cache.get(doc_key),
+                                              analyze_sentiment, content)
+        else:
+            sentiment_step = asyncio.sleep(0)  # resolves to None
+        try:
+            summary, key_points, sentiment = await asyncio.gather(
+                _compute_missing(self._summary_cache.get((doc_key, summary_length)),
+                                 generate_summary, content, summary_length),
+                _compute_missing(self._key_points_cache.get(doc_key),
+                                 extract_key_points, content),
+                sentiment_step
+            )
+        except Exception as e:
+            self.on_analysis_error(str(e))
+            return
         
-        # Simulate analysis results
-        results = {
-            'type': analysis_type,
-            'summary': self.generate_summary(content),
-            'key_points': self.extract_key_points(content),
-            'readability': self.analyze_readability(content),
-            'sentiment': self.analyze_sentiment(content) if self.include_sentiment.isChecked() else None
-        }
+        # The document may have been removed while the analysis was running
+        if doc_key not in self.doc_ids:
+            self.progress_bar.setVisible(False)
+            self._set_analysis_enabled(True)
+            self.statusBar().showMessage("Analysis discarded: document was removed")
+            return
         
+        self._on_analysis_computed(doc_key, summary_length, {
+            'type': analysis_type,
+            'summary': summary,
+            'key_points': key_points,
+            'readability': readability,
+            'sentiment': sentiment
+        })
+    
+    def _on_analysis_computed(self, doc_key: int, summary_length: int, results: dict):
+        """Cache freshly computed sub-results, then show them if still relevant."""
+        self._summary_cache[(doc_key, summary_length)] = results['summary']
+        self._key_points_cache[doc_key] = results['key_points']
+        if results['sentiment'] is not None:
+            self._sentiment_cache[doc_key] = results['sentiment']
+        
+        # Another document may have been selected while the analysis was running;
+        # its results stay cached but must not replace the current view
+        if self.current_row < 0 or self.doc_ids[self.current_row] != doc_key:
+            self.progress_bar.setVisible(False)
+            self._set_analysis_enabled(True)
+            self.statusBar().showMessage("Analysis cached: a different document is selected")
+            return
+        self.on_analysis_finished(results)
+    
+    def _set_analysis_enabled(self, enabled: bool):
+        """Enable or disable every control that starts an analysis."""
+        self.analyze_btn.setEnabled(enabled)
+        for action in self.analyze_actions:
+            action.setEnabled(enabled)
+    
+    def _drop_analysis_caches(self, doc_key: int):
+        """Drop the cached analysis results of one document."""
+        for summary_key in [key for key in self._summary_cache if key[0] == doc_key]:
+            del self._summary_cache[summary_key]
+        self._key_points_cache.pop(doc_key, None)
+        self._sentiment_cache.pop(doc_key, None)
+    
+    def _clear_analysis_caches(self):
+        """Drop all cached analysis results."""
+        self._summary_cache.clear()
+        self._key_points_cache.clear()
+        self._sentiment_cache.clear()
+    
+    def on_analysis_finished(self, results: dict):
+        """Handle completed analysis."""
         self.analysis_results = results
         self.display_results(results)
         
         # Update progress
         self.progress_bar.setValue(100)
-        self.analyze_btn.setEnabled(True)
+        self._set_analysis_enabled(True)
         self.statusBar().showMessage("Analysis complete!")
         
         # Hide progress bar after 2 seconds
         QTimer.singleShot(2000, lambda: self.progress_bar.setVisible(False))
     
-    def generate_summary(self, content: str) -> str:
-        """Generate document summary."""
-        sentences = content.split('.')
-        summary_length = self.summary_length.value()
-        words = 0
-        summary_sentences = []
-        
-        for sentence in sentences:
-            words += len(sentence.split())
-            if words <= summary_length:
-                summary_sentences.append(sentence.strip())
-            else:
-                break
-        
-        return ". ".join(summary_sentences) + "." if summary_sentences else "No summary available."
-    
-    def extract_key_points(self, content: str) -> list:
-        """Extract key points from document."""
-        sentences = content.split('.')
-        key_points = []
-        
-        for i, sentence in enumerate(sentences[:5]):
-            if sentence.strip():
-                key_points.append(f"• {sentence.strip()}")
-        
-        return key_points if key_points else ["No key points found."]
-    
-    def analyze_readability(self, content: str) -> dict:
-        """Analyze document readability."""
-        words = len(content.split())
-        sentences = len(content.split('.'))
-        paragraphs = len(content.split('\n\n'))
-        
-        avg_word_length = sum(len(w) for w in content.split()) / max(words, 1)
-        
-        return {
-            'word_count': words,
-            'sentence_count': sentences,
-            'paragraph_count': paragraphs,
-            'avg_word_length': f"{avg_word_length:.2f}",
-            'readability_score': "Easy" if avg_word_length < 5 else "Medium" if avg_word_length < 7 else "Hard"
-        }
-    
-    def analyze_sentiment(self, content: str) -> dict:
-        """Analyze document sentiment."""
-        positive_words = ['good', 'great', 'excellent', 'amazing', 'wonderful']
-        negative_words = ['bad', 'poor', 'terrible', 'awful', 'horrible']
-        
-        positive_count = sum(1 for word in positive_words if word in content.lower())
-        negative_count = sum(1 for word in negative_words if word in content.lower())
-        
-        if positive_count > negative_count:
-            sentiment = "Positive"
-        elif negative_count > positive_count:
-            sentiment = "Negative"
-        else:
-            sentiment = "Neutral"
-        
-        return {
-            'sentiment': sentiment,
-            'positive_words': positive_count,
-            'negative_words': negative_count
-        }
+    def on_analysis_error(self, message: str):
+        """Handle failed analysis."""
+        self.progress_bar.setVisible(False)
+        self._set_analysis_enabled(True)
+        QMessageBox.critical(self, "Error", f"Analysis failed: {message}")
+        self.statusBar().showMessage("Error analyzing document")
     
     def display_results(self, results: dict):
         """Display analysis results in results view."""
-        result_text = f"Analysis Type: {results['type']}\n"
-        result_text += "=" * 50 + "\n\n"
-        
-        result_text += "SUMMARY:\n"
-        result_text += "-" * 50 + "\n"
-        result_text += f"{results['summary']}\n\n"
+        rule = "-" * 50 + "\n"
+        parts: List[str] = [
+            f"Analysis Type: {results['type']}\n",
+            "=" * 50 + "\n\n",
+            "SUMMARY:\n",
+            rule,
+            f"{results['summary']}\n\n",
+        ]
         
         if self.highlight_key_points.isChecked():
-            result_text += "KEY POINTS:\n"
-            result_text += "-" * 50 + "\n"
+            parts.append("KEY POINTS:\n")
+            parts.append(rule)
             for point in results['key_points']:
-                result_text += f"{point}\n"
-            result_text += "\n"
+                parts.append(f"{point}\n")
+            parts.append("\n")
         
-        result_text += "READABILITY ANALYSIS:\n"
-        result_text += "-" * 50 + "\n"
         readability = results['readability']
-        result_text += f"Word Count: {readability['word_count']}\n"
-        result_text += f"Sentence Count: {readability['sentence_count']}\n"
-        result_text += f"Paragraph Count: {readability['paragraph_count']}\n"
-        result_text += f"Avg Word Length: {readability['avg_word_length']}\n"
-        result_text += f"Readability Score: {readability['readability_score']}\n\n"
+        parts.extend([
+            "READABILITY ANALYSIS:\n",
+            rule,
+            f"Word Count: {readability['word_count']}\n",
+            f"Sentence Count: {readability['sentence_count']}\n",
+            f"Paragraph Count: {readability['paragraph_count']}\n",
+            f"Avg Word Length: {readability['avg_word_length']}\n",
+            f"Readability Score: {readability['readability_score']}\n\n",
+        ])
         
         if results['sentiment'] and self.include_sentiment.isChecked():
-            result_text += "SENTIMENT ANALYSIS:\n"
-            result_text += "-" * 50 + "\n"
             sentiment = results['sentiment']
-            result_text += f"Overall Sentiment: {sentiment['sentiment']}\n"
-            result_text += f"Positive Words: {sentiment['positive_words']}\n"
-            result_text += f"Negative Words: {sentiment['negative_words']}\n"
-        
-        self.results_view.setText(result_text)
+            parts.extend([
+                "SENTIMENT ANALYSIS:\n",
+                rule,
+                f"Overall Sentiment: {sentiment['sentiment']}\n",
+                f"Positive Words: {sentiment['positive_words']}\n",
+                f"Negative Words: {sentiment['negative_words']}\n",
+            ])
+        
+        self.results_view.setPlainText("".join(parts))
     
     def export_results(self):
         """Export analysis results to file."""
@@ -557,11 +879,20 @@ class MainWindow(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.documents.clear()
+            self.doc_names.clear()
+            self.doc_paths.clear()
+            self.doc_contents.clear()
+            self.doc_metrics.clear()
+            self.doc_ids.clear()
+            # Blocked so emptying the list does not emit a selection change per row
+            self.document_list.blockSignals(True)
             self.document_list.clear()
+            self.document_list.blockSignals(False)
             self.document_view.clear()
             self.results_view.clear()
-            self.current_document = None
+            self.current_row = -1
+            self._last_selected_row = -1
+            self._clear_analysis_caches()
             self.analysis_results = {}
             self.statusBar().showMessage("All data cleared")
     
@@ -583,7 +914,7 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle application close event."""
-        if self.documents:
+        if self.doc_names:
             reply = QMessageBox.question(
                 self,
                 "Confirm Exit",
@@ -605,11 +936,16 @@ def main():
     # Set application style
     app.setStyle('Fusion')
     
+    # Run Qt on top of an asyncio event loop so analysis can be awaited
+    loop = QEventLoop(app)
+    asyncio.set_event_loop(loop)
+    
     # Create and show main window
     window = MainWindow()
     window.show()
     
-    sys.exit(app.exec())
+    with loop:
+        sys.exit(loop.run_forever())
 
 
 if __name__ == "__main__":
@@ -5,10 +5,125 @@ This module provides a GUI panel for displaying words during reading sessions.
 It includes word presentation, pronunciation controls, and definition display.
 """
 
+import logging
+import queue
+import re
+import threading
 import tkinter as tk
 from tkinter import ttk
-import tts
-from typing import Optional, Callable
+import tkinter.font as tkfont
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Whitespace that follows a sentence-ending mark; compiled once for streaming TTS
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+
+@lru_cache(maxsize=None)
+def _get_tts():
+    """
+    Import the TTS backend on first use.
+    
+    The backend pulls in audio libraries that are slow to load, so the
+    import is deferred until something is actually spoken. Only call this
+    from the TTS worker pool; a failed import is remembered, not retried.
+    
+    Returns:
+        The tts module, or None if it cannot be imported
+    """
+    try:
+        import tts
+    except ImportError as e:
+        logger.warning("TTS backend unavailable, speech is disabled: %s", e)
+        return None
+    return tts
+
+
+@lru_cache(maxsize=512)
+def _synthesize(word: str) -> bytes:
+    """
+    Synthesize the audio for a word, memoized per word.
+    
+    Repeated words are common while reading, so repeat pronunciations skip
+    the synthesis step and only replay the cached audio.
+    
+    Args:
+        word: Word to synthesize
+        
+    Returns:
+        Raw audio produced by the TTS backend
+    """
+    return _get_tts().synth_to_bytes(word)
+
+
+@lru_cache(maxsize=None)
+def _tts_engine():
+    """
+    Return the backend's reusable speech engine, creating it on first use.
+    
+    Returns:
+        Engine from tts.get_engine(), or None if the backend is missing or
+        has no such handle
+    """
+    get_engine = getattr(_get_tts(), 'get_engine', None)
+    return get_engine() if get_engine is not None else None
+
+
+def _speak_now(text: str) -> None:
+    """
+    Speak text synchronously, reusing one engine for every utterance.
+    
+    Callers must hold WordDisplayPanel._playback_lock.
+    
+    Args:
+        text: Text to speak
+    """
+    engine = _tts_engine()
+    if engine is not None:
+        engine.say(text)
+        engine.runAndWait()
+    else:
+        tts = _get_tts()
+        if tts is not None:
+            tts.speak(text)
+
+
+def _split_sentences(text: str) -> Iterator[str]:
+    """Yield the non-empty sentences of a text, split after . ! or ?."""
+    # Walk the separators lazily instead of building the full list of splits
+    start = 0
+    for match in _SENT_SPLIT.finditer(text):
+        if match.start() > start:
+            yield text[start:match.start()]
+        start = match.end()
+    if start < len(text):
+        yield text[start:]
+
+
+def _can_cache_audio() -> bool:
+    """Check whether the TTS backend exposes separate synthesis and playback."""
+    tts = _get_tts()
+    return (tts is not None and hasattr(tts, 'synth_to_bytes')
+            and hasattr(tts, 'play_bytes'))
+
+
+def _presynthesize(word: str) -> Optional[bytes]:
+    """
+    Synthesize a word ahead of playback; runs on the TTS worker pool.
+    
+    Args:
+        word: Word to synthesize
+        
+    Returns:
+        Raw audio, or None if the backend cannot synthesize separately
+    """
+    if not _can_cache_audio():
+        return None
+    return _synthesize(word)
 
 
 class WordDisplayPanel(ttk.Frame):
@@ -22,26 +137,85 @@ class WordDisplayPanel(ttk.Frame):
     - Visual feedback for reading progress
     """
     
-    def __init__(self, parent, on_word_selected: Optional[Callable] = None, **kwargs):
+    # Speech runs off the Tk thread so synthesis and playback never freeze the UI
+    _tts_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts")
+    # Only one utterance plays at a time
+    _playback_lock = threading.Lock()
+    # Number of speculatively synthesized words kept around
+    _PREFETCH_LIMIT = 4
+    # Longer utterances are spoken sentence by sentence as they are synthesized
+    _STREAM_THRESHOLD = 40
+    # Navigation clicks within this many milliseconds are merged into one step
+    _NAV_DEBOUNCE_MS = 120
+    # Examples rendered per page; further pages are added as the view scrolls
+    _EXAMPLES_PAGE = 20
+    # TTS toggle button labels
+    _TTS_ON_TEXT = "🔔 TTS On"
+    _TTS_OFF_TEXT = "🔔 TTS Off"
+    
+    def __init__(self, parent, on_word_selected: Optional[Callable] = None,
+                 lookup: Optional[Callable[[str], Tuple]] = None, **kwargs):
         """
         Initialize the Word Display Panel.
         
         Args:
             parent: Parent widget
-            on_word_selected: Callback function when word is selected
+            on_word_selected: Callback function when word is selected; receives
+                the number of words to move (negative for backwards)
+            lookup: Dictionary lookup returning (phonetic, part_of_speech,
+                definition, examples) for a word; used by show_word
             **kwargs: Additional arguments for ttk.Frame
         """
         super().__init__(parent, **kwargs)
         
         self.on_word_selected = on_word_selected
+        # Memoized, since readers navigate back to words they have already seen
+        self.lookup = lru_cache(maxsize=4096)(lookup) if lookup else None
         self.current_word = None
         self.current_definition = None
         self.tts_enabled = True
+        self._tts_future: Optional[Future] = None
+        # Bumped whenever queued speech is superseded; workers holding an
+        # older value skip playback even if cancelling their task failed
+        self._tts_generation = 0
+        # In-flight or finished syntheses started by preload_word, oldest first
+        self._prefetch: Dict[str, Future] = OrderedDict()
+        # Pending navigation: accumulated direction and the scheduled callback
+        self._pending_delta = 0
+        self._nav_after_id: Optional[str] = None
+        # Text last written to each label, so unchanged values skip the Tk update
+        self._last = {'word': "—", 'phonetic': "", 'info': "", 'progress': "Word: 0 / 0"}
+        # Examples of the displayed word and how many of them are rendered
+        self._all_examples: list = []
+        self._examples_shown = 0
+        # Definition and examples currently rendered, to skip identical redraws
+        self._last_details_key: Optional[tuple] = None
+        # Latest progress waiting to be drawn at the next idle point
+        self._pending_progress: Optional[Tuple[int, int]] = None
+        self._progress_scheduled = False
+        # " / total" part of the progress text, rebuilt only when total changes
+        self._progress_total: Optional[int] = None
+        self._progress_suffix = ""
+        # Arguments of a display_word call made while the panel was hidden
+        self._pending_display: Optional[tuple] = None
         
         self._setup_ui()
+        # Render whatever was displayed while hidden once the panel is shown
+        self.bind('<Map>', lambda event: self._flush_if_dirty())
     
     def _setup_ui(self) -> None:
         """Set up the user interface components."""
+        # Shared font objects, resolved by Tk once instead of per widget
+        self._fonts = {
+            'huge_bold': tkfont.Font(self, family="Helvetica", size=48, weight="bold"),
+            'italic_16': tkfont.Font(self, family="Helvetica", size=16, slant="italic"),
+            'small_12': tkfont.Font(self, family="Helvetica", size=12),
+            'body_11': tkfont.Font(self, family="Helvetica", size=11),
+            'body_bold_11': tkfont.Font(self, family="Helvetica", size=11, weight="bold"),
+            'italic_10': tkfont.Font(self, family="Helvetica", size=10, slant="italic"),
+            'small_10': tkfont.Font(self, family="Helvetica", size=10),
+        }
+        
         # Configure grid layout
         self.columnconfigure(0, weight=1)
         self.rowconfigure(1, weight=1)
@@ -57,6 +231,13 @@ class WordDisplayPanel(ttk.Frame):
         
         # Bottom navigation bar
         self._create_navigation_bar()
+        
+        # Resolve the emoji font fallback and lay out the panel now, so the
+        # first click doesn't pay for glyph lookup
+        button_font = tkfont.Font(self, name="TkDefaultFont", exists=True)
+        for label in ("🔊 Pronounce", self._TTS_ON_TEXT, self._TTS_OFF_TEXT, "⚙️ Settings"):
+            button_font.measure(label)
+        self.update_idletasks()
     
     def _create_control_bar(self) -> None:
         """Create the top control bar with audio controls."""
@@ -78,7 +259,7 @@ class WordDisplayPanel(ttk.Frame):
         # TTS toggle button
         self.tts_btn = ttk.Button(
             control_frame,
-            text="🔔 TTS On",
+            text=self._TTS_ON_TEXT,
             command=self._toggle_tts
         )
         self.tts_btn.grid(row=0, column=2, padx=2)
@@ -98,11 +279,16 @@ class WordDisplayPanel(ttk.Frame):
         display_frame.columnconfigure(0, weight=1)
         display_frame.rowconfigure(1, weight=1)
         
+        # Label texts are bound to variables so updates are a single variable write
+        self._word_var = tk.StringVar(self, value="—")
+        self._phonetic_var = tk.StringVar(self, value="")
+        self._info_var = tk.StringVar(self, value="")
+        
         # Word text display
         self.word_label = tk.Label(
             display_frame,
-            text="—",
-            font=("Helvetica", 48, "bold"),
+            textvariable=self._word_var,
+            font=self._fonts['huge_bold'],
             fg="#2c3e50"
         )
         self.word_label.grid(row=0, column=0, sticky='ew', pady=10)
@@ -110,8 +296,8 @@ class WordDisplayPanel(ttk.Frame):
         # Phonetic transcription
         self.phonetic_label = tk.Label(
             display_frame,
-            text="",
-            font=("Helvetica", 16, "italic"),
+            textvariable=self._phonetic_var,
+            font=self._fonts['italic_16'],
             fg="#7f8c8d"
         )
         self.phonetic_label.grid(row=1, column=0, sticky='ew', pady=5)
@@ -119,8 +305,8 @@ class WordDisplayPanel(ttk.Frame):
         # Part of speech and additional info
         self.info_label = tk.Label(
             display_frame,
-            text="",
-            font=("Helvetica", 12),
+            textvariable=self._info_var,
+            font=self._fonts['small_12'],
             fg="#34495e"
         )
         self.info_label.grid(row=2, column=0, sticky='ew', pady=5)
@@ -138,22 +324,22 @@ class WordDisplayPanel(ttk.Frame):
         text_frame.columnconfigure(0, weight=1)
         text_frame.rowconfigure(0, weight=1)
         
-        scrollbar = ttk.Scrollbar(text_frame)
-        scrollbar.grid(row=0, column=1, sticky='ns')
+        self._definition_scrollbar = ttk.Scrollbar(text_frame)
+        self._definition_scrollbar.grid(row=0, column=1, sticky='ns')
         
         self.definition_text = tk.Text(
             text_frame,
             wrap=tk.WORD,
-            yscrollcommand=scrollbar.set,
-            font=("Helvetica", 11),
+            yscrollcommand=self._on_definition_scroll,
+            font=self._fonts['body_11'],
             height=6
         )
         self.definition_text.grid(row=0, column=0, sticky='nsew')
-        scrollbar.config(command=self.definition_text.yview)
+        self._definition_scrollbar.config(command=self.definition_text.yview)
         
         # Configure text tags for formatting
-        self.definition_text.tag_config('definition', foreground='#2c3e50', font=("Helvetica", 11, "bold"))
-        self.definition_text.tag_config('example', foreground='#7f8c8d', font=("Helvetica", 10, "italic"))
+        self.definition_text.tag_config('definition', foreground='#2c3e50', font=self._fonts['body_bold_11'])
+        self.definition_text.tag_config('example', foreground='#7f8c8d', font=self._fonts['italic_10'])
         self.definition_text.config(state=tk.DISABLED)
     
     def _create_navigation_bar(self) -> None:
@@ -171,10 +357,11 @@ class WordDisplayPanel(ttk.Frame):
         prev_btn.grid(row=0, column=0, padx=2)
         
         # Word count and progress
+        self._progress_var = tk.StringVar(self, value="Word: 0 / 0")
         self.progress_label = tk.Label(
             nav_frame,
-            text="Word: 0 / 0",
-            font=("Helvetica", 10),
+            textvariable=self._progress_var,
+            font=self._fonts['small_10'],
             fg="#7f8c8d"
         )
         self.progress_label.grid(row=0, column=1, padx=5)
@@ -202,14 +389,31 @@ class WordDisplayPanel(ttk.Frame):
         self.current_word = word
         self.current_definition = definition
         
+        # While hidden (e.g. in an inactive notebook tab) only remember the
+        # latest word; it is rendered and spoken when the panel is mapped
+        if not self.winfo_ismapped():
+            self._pending_display = (word, phonetic, part_of_speech, definition, examples)
+            return
+        self._pending_display = None
+        self._render_word(word, phonetic, part_of_speech, definition, examples)
+    
+    def _flush_if_dirty(self) -> None:
+        """Display the word that arrived while the panel was hidden."""
+        if self._pending_display is not None:
+            pending, self._pending_display = self._pending_display, None
+            self._render_word(*pending)
+    
+    def _render_word(self, word: str, phonetic: str, part_of_speech: str,
+                     definition: str, examples: Optional[list]) -> None:
+        """Update the labels and definition for a word and pronounce it."""
         # Update word display
-        self.word_label.config(text=word)
+        self._set_if_changed(self._word_var, 'word', word)
         
         # Update phonetic transcription
-        self.phonetic_label.config(text=f"/{phonetic}/" if phonetic else "")
+        self._set_if_changed(self._phonetic_var, 'phonetic', f"/{phonetic}/" if phonetic else "")
         
         # Update part of speech and additional info
-        self.info_label.config(text=part_of_speech)
+        self._set_if_changed(self._info_var, 'info', part_of_speech)
         
         # Update definitions and examples
         self._update_definition_display(definition, examples or [])
@@ -218,32 +422,123 @@ class WordDisplayPanel(ttk.Frame):
         if self.tts_enabled:
             self._pronounce_word(word)
     
+    def show_word(self, word: str) -> None:
+        """
+        Look up a word with the memoized lookup and display it.
+        
+        Args:
+            word: The word to display
+        """
+        if self.lookup is None:
+            self.display_word(word)
+            return
+        phonetic, part_of_speech, definition, examples = self.lookup(word)
+        # Copy the examples so the cached entry can't be modified by callers
+        self.display_word(word, phonetic, part_of_speech, definition, list(examples))
+    
     def _update_definition_display(self, definition: str, examples: list) -> None:
         """Update the definition and examples display."""
+        details_key = (definition, tuple(examples))
+        if details_key == self._last_details_key:
+            return
+        self._last_details_key = details_key
+        
         self.definition_text.config(state=tk.NORMAL)
         self.definition_text.delete(1.0, tk.END)
         
+        # Alternating (text, tags) pairs, inserted with a single Text.insert call
+        chunks = []
         if definition:
-            self.definition_text.insert(tk.END, "Definition:\n", "definition")
-            self.definition_text.insert(tk.END, definition + "\n\n")
+            chunks += ["Definition:\n", "definition", definition + "\n\n", ()]
         
+        # Only the first page of examples is rendered up front
+        self._all_examples = examples
+        self._examples_shown = min(len(examples), self._EXAMPLES_PAGE)
         if examples:
-            self.definition_text.insert(tk.END, "Examples:\n", "definition")
-            for i, example in enumerate(examples, 1):
-                self.definition_text.insert(tk.END, f"{i}. ", "example")
-                self.definition_text.insert(tk.END, example + "\n")
+            chunks += ["Examples:\n", "definition"]
+            chunks += self._example_chunks(0, self._examples_shown)
+        
+        if chunks:
+            self.definition_text.insert(tk.END, *chunks)
         
         self.definition_text.config(state=tk.DISABLED)
     
+    def _example_chunks(self, start: int, end: int) -> list:
+        """
+        Build the (text, tags) insert pairs for a range of examples.
+        
+        Args:
+            start: Index of the first example
+            end: Index one past the last example
+            
+        Returns:
+            Alternating text and tag arguments for Text.insert
+        """
+        chunks = []
+        for i in range(start, end):
+            chunks += [f"{i + 1}. ", "example", self._all_examples[i] + "\n", ()]
+        return chunks
+    
+    def _on_definition_scroll(self, first: str, last: str) -> None:
+        """
+        Update the scrollbar and render more examples near the end of the view.
+        
+        Tk also calls this when the content fits in the view, so pages keep
+        being added until the widget can scroll or every example is shown.
+        
+        Args:
+            first: Fraction of the content above the view
+            last: Fraction of the content up to the bottom of the view
+        """
+        self._definition_scrollbar.set(first, last)
+        if self._examples_shown < len(self._all_examples) and float(last) > 0.9:
+            start = self._examples_shown
+            self._examples_shown = min(len(self._all_examples), start + self._EXAMPLES_PAGE)
+            self.definition_text.config(state=tk.NORMAL)
+            self.definition_text.insert(tk.END, *self._example_chunks(start, self._examples_shown))
+            self.definition_text.config(state=tk.DISABLED)
+    
     def update_progress(self, current: int, total: int) -> None:
         """
         Update the progress display.
         
+        Updates are drawn at the next idle point, so a burst of calls only
+        redraws the label once, with the latest values.
+        
         Args:
             current: Current word index
             total: Total number of words
         """
-        self.progress_label.config(text=f"Word: {current} / {total}")
+        self._pending_progress = (current, total)
+        if not self._progress_scheduled:
+            self._progress_scheduled = True
+            self.after_idle(self._flush_progress)
+    
+    def _flush_progress(self) -> None:
+        """Draw the most recent progress passed to update_progress."""
+        self._progress_scheduled = False
+        if self._pending_progress is None:
+            return
+        current, total = self._pending_progress
+        self._pending_progress = None
+        if total != self._progress_total:
+            self._progress_total = total
+            self._progress_suffix = f" / {total}"
+        self._set_if_changed(self._progress_var, 'progress',
+                             "Word: " + str(current) + self._progress_suffix)
+    
+    def _set_if_changed(self, variable: tk.StringVar, key: str, value: str) -> None:
+        """
+        Set a label's text variable only if it differs from what was last written.
+        
+        Args:
+            variable: Text variable bound to the label
+            key: Name of the label in the last-written cache
+            value: New label text
+        """
+        if self._last[key] != value:
+            variable.set(value)
+            self._last[key] = value
     
     def _on_pronounce(self) -> None:
         """Handle pronunciation button click."""
@@ -252,21 +547,118 @@ class WordDisplayPanel(ttk.Frame):
     
     def _pronounce_word(self, word: str) -> None:
         """
-        Pronounce the given word using TTS.
+        Pronounce the given word using TTS on a background thread.
         
         Args:
             word: Word to pronounce
         """
+        # A word still waiting to be spoken is superseded by the new one
+        if self._tts_future is not None:
+            self._tts_future.cancel()
+        self._tts_generation += 1
+        prefetched = self._prefetch.pop(word, None)
+        self._tts_future = self._tts_pool.submit(self._speak, word, prefetched,
+                                                 self._tts_generation)
+    
+    def preload_word(self, word: str) -> None:
+        """
+        Start synthesizing a word that is likely to be displayed next.
+        
+        The host application can call this for the neighbouring words while
+        the current one is being read, so navigating to them plays audio
+        without waiting for synthesis.
+        
+        Args:
+            word: Word to synthesize ahead of time
+        """
+        # The backend is probed by the worker, so this never imports it on the Tk thread
+        if not self.tts_enabled or word in self._prefetch:
+            return
+        self._prefetch[word] = self._tts_pool.submit(_presynthesize, word)
+        while len(self._prefetch) > self._PREFETCH_LIMIT:
+            self._prefetch.popitem(last=False)
+    
+    def _speak(self, word: str, prefetched: Optional[Future] = None,
+               generation: int = 0) -> None:
+        """
+        Synthesize and play a word; runs on the TTS worker pool.
+        
+        Args:
+            word: Word to speak
+            prefetched: Synthesis started earlier by preload_word, if any
+            generation: Value of _tts_generation when the word was queued
+        """
         try:
-            tts.speak(word)
+            if len(word) > self._STREAM_THRESHOLD:
+                self._speak_stream(word, generation)
+            elif _can_cache_audio():
+                if prefetched is not None:
+                    audio = prefetched.result()
+                else:
+                    audio = _synthesize(word)
+                with self._playback_lock:
+                    if generation == self._tts_generation:
+                        _get_tts().play_bytes(audio)
+            else:
+                with self._playback_lock:
+                    if generation == self._tts_generation:
+                        _speak_now(word)
         except Exception as e:
-            print(f"Error pronouncing word '{word}': {e}")
+            logger.warning("Error pronouncing word '%s': %s", word, e)
+    
+    def _speak_stream(self, text: str, generation: int) -> None:
+        """
+        Speak a longer text one sentence at a time.
+        
+        Audio starts after the first sentence is synthesized. A producer
+        thread synthesizes up to two sentences ahead of playback. Playback
+        stops between sentences once newer speech has been queued.
+        
+        Args:
+            text: Text to speak
+            generation: Value of _tts_generation when the text was queued
+        """
+        if not _can_cache_audio():
+            with self._playback_lock:
+                for sentence in _split_sentences(text):
+                    if generation != self._tts_generation:
+                        return
+                    _speak_now(sentence)
+            return
+        
+        tts = _get_tts()
+        chunks: queue.Queue = queue.Queue(maxsize=2)
+        stop = threading.Event()
+        
+        def produce() -> None:
+            try:
+                for sentence in _split_sentences(text):
+                    if stop.is_set():
+                        return
+                    chunks.put(tts.synth_to_bytes(sentence))
+            except Exception as e:
+                chunks.put(e)
+            chunks.put(None)
+        
+        threading.Thread(target=produce, name="tts-stream", daemon=True).start()
+        try:
+            with self._playback_lock:
+                while (audio := chunks.get()) is not None:
+                    if isinstance(audio, Exception):
+                        raise audio
+                    if generation != self._tts_generation:
+                        return
+                    tts.play_bytes(audio)
+        finally:
+            # If playback failed, unblock the producer so its thread can exit
+            stop.set()
+            while not chunks.empty():
+                chunks.get_nowait()
     
     def _toggle_tts(self) -> None:
         """Toggle TTS on/off."""
         self.tts_enabled = not self.tts_enabled
-        status = "TTS On" if self.tts_enabled else "TTS Off"
-        self.tts_btn.config(text=f"🔔 {status}")
+        self.tts_btn.config(text=self._TTS_ON_TEXT if self.tts_enabled else self._TTS_OFF_TEXT)
     
     def _on_settings(self) -> None:
         """Handle settings button click."""
@@ -275,25 +667,56 @@ class WordDisplayPanel(ttk.Frame):
     
     def _on_previous(self) -> None:
         """Handle previous word button click."""
-        if self.on_word_selected:
-            self.on_word_selected(-1)
+        self._queue_navigation(-1)
     
     def _on_next(self) -> None:
         """Handle next word button click."""
-        if self.on_word_selected:
-            self.on_word_selected(1)
+        self._queue_navigation(1)
+    
+    def _queue_navigation(self, direction: int) -> None:
+        """
+        Accumulate a navigation step and report it once clicks settle.
+        
+        Args:
+            direction: -1 for previous, 1 for next
+        """
+        if not self.on_word_selected:
+            return
+        self._pending_delta += direction
+        if self._nav_after_id is not None:
+            self.after_cancel(self._nav_after_id)
+        self._nav_after_id = self.after(self._NAV_DEBOUNCE_MS, self._flush_navigation)
+    
+    def _flush_navigation(self) -> None:
+        """Pass the accumulated navigation offset to the callback."""
+        delta = self._pending_delta
+        self._pending_delta = 0
+        self._nav_after_id = None
+        if delta and self.on_word_selected:
+            self.on_word_selected(delta)
     
     def clear(self) -> None:
         """Clear the word display."""
+        # Drop speech that has not started yet so no stale audio plays
+        if self._tts_future is not None:
+            self._tts_future.cancel()
+            self._tts_future = None
+        self._tts_generation += 1
         self.current_word = None
         self.current_definition = None
-        self.word_label.config(text="—")
-        self.phonetic_label.config(text="")
-        self.info_label.config(text="")
+        self._pending_display = None
+        self._set_if_changed(self._word_var, 'word', "—")
+        self._set_if_changed(self._phonetic_var, 'phonetic', "")
+        self._set_if_changed(self._info_var, 'info', "")
         self.definition_text.config(state=tk.NORMAL)
         self.definition_text.delete(1.0, tk.END)
         self.definition_text.config(state=tk.DISABLED)
-        self.progress_label.config(text="Word: 0 / 0")
+        self._all_examples = []
+        self._examples_shown = 0
+        self._last_details_key = None
+        # A progress update still waiting for idle time would undo the reset
+        self._pending_progress = None
+        self._set_if_changed(self._progress_var, 'progress', "Word: 0 / 0")
     
     def get_current_word(self) -> Optional[str]:
         """Get the currently displayed word."""
@@ -307,8 +730,7 @@ class WordDisplayPanel(ttk.Frame):
             enabled: True to enable TTS, False to disable
         """
         self.tts_enabled = enabled
-        status = "TTS On" if enabled else "TTS Off"
-        self.tts_btn.config(text=f"🔔 {status}")
+        self.tts_btn.config(text=self._TTS_ON_TEXT if enabled else self._TTS_OFF_TEXT)
 
 
 if __name__ == "__main__":
@@ -34,7 +34,7 @@ def main():
         print("Welcome to AI Reading Assistant!")
         
     except Exception as e:
-        logger.error(f"An error occurred: {e}", exc_info=True)
+        logger.error("An error occurred: %s", e, exc_info=True)
         sys.exit(1)
 
 